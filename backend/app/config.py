@@ -3,6 +3,9 @@ from pathlib import Path
 # Configuration for Sorty results
 RESULTS_ROOT = Path("/Users/dkaleper/Documents/Miscellaneous Resources/Code Projects/brs-ui-project/test_data/out/results")  # Change this path as needed
 
+# Pre-rendered snapshots and image variants, shared by the API and app.prerender
+CACHE_ROOT = RESULTS_ROOT.parent / "render_cache"
+
 # API Configuration
 API_HOST = "127.0.0.1"
 API_PORT = 8000
@@ -1,12 +1,13 @@
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import math
 import re
 import zipfile
 import numpy as np
 
 from .config import RESULTS_ROOT
-from .models import CaptureSummary, CaptureDetail
+from .models import CaptureSummary, CaptureDetail, PointCloudInfo
 from .manifest import load_manifest
 
 
@@ -40,13 +41,24 @@ def get_captures_for_date(date: str) -> List[CaptureSummary]:
     return sorted(captures, key=lambda x: x.capture_id)
 
 
+def get_capture_path(date: str, capture_id: str) -> Optional[Path]:
+    """Get the full path to a capture folder"""
+    capture_path = RESULTS_ROOT / date / capture_id
+    return capture_path if capture_path.exists() else None
+
+
 def get_capture_detail(date: str, capture_id: str) -> Optional[CaptureDetail]:
     """Get detailed information for a specific capture"""
-    capture_path = RESULTS_ROOT / date / capture_id
+    capture_path = get_capture_path(date, capture_id)
     
-    if not capture_path.exists():
+    if capture_path is None:
         return None
     
+    return build_capture_detail(capture_path, date, capture_id)
+
+
+def build_capture_detail(capture_path: Path, date: str, capture_id: str) -> CaptureDetail:
+    """Build capture detail for an already resolved capture folder"""
     # Load manifest if exists
     manifest = load_manifest(capture_path)
     
@@ -127,7 +139,10 @@ def _check_point_cloud_exists(capture_path: Path) -> bool:
 
 def get_point_cloud_path(date: str, capture_id: str) -> Optional[Path]:
     """Get the full path to a point cloud file, extracting from zip if needed"""
-    capture_path = RESULTS_ROOT / date / capture_id
+    return resolve_point_cloud_file(RESULTS_ROOT / date / capture_id)
+
+def resolve_point_cloud_file(capture_path: Path) -> Optional[Path]:
+    """Get the point cloud file in a capture folder, extracting from zip if needed"""
     npy_path = capture_path / "point_cloud.npy"
     zip_path = capture_path / "point_cloud.zip"
     
@@ -149,11 +164,58 @@ def get_point_cloud_path(date: str, capture_id: str) -> Optional[Path]:
     
     return None
 
+def load_point_cloud_info(pc_path: Optional[Path]) -> PointCloudInfo:
+    """Get point count and file size for a point cloud file"""
+    if not pc_path:
+        return PointCloudInfo(exists=False)
+    
+    try:
+        # Memory-map so only the header is read to get the shape
+        point_cloud = np.load(pc_path, mmap_mode='r')
+        num_points = len(point_cloud) if point_cloud.ndim > 0 else 0
+        file_size = pc_path.stat().st_size
+        
+        return PointCloudInfo(
+            exists=True,
+            num_points=num_points,
+            file_size=file_size
+        )
+    except Exception as e:
+        return PointCloudInfo(exists=True, num_points=None, file_size=pc_path.stat().st_size)
+
 def get_brick_info_path(date: str, capture_id: str) -> Optional[Path]:
     """Get the full path to the brick_info.txt file"""
     info_path = RESULTS_ROOT / date / capture_id / "brick_info.txt"
     return info_path if info_path.exists() else None
 
+def parse_brick_info(capture_path: Path) -> Optional[Dict[str, Any]]:
+    """Parse brick_info.txt into a dict of snake_case keys to values"""
+    info_path = capture_path / "brick_info.txt"
+    if not info_path.exists():
+        return None
+    
+    info: Dict[str, Any] = {}
+    with open(info_path, 'r') as f:
+        for line in f:
+            key, sep, value = line.partition(':')
+            key, value = key.strip(), value.strip()
+            if not sep or not key or not value:
+                continue
+            info[key.lower().replace(' ', '_')] = _parse_brick_info_value(value)
+    return info
+
+def _parse_brick_info_value(value: str) -> Any:
+    """Convert numeric brick_info values to numbers, leave the rest as strings"""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
 ## I want to create an endpoint that downsamples the point cloud and returns the downsampled data as a list of points.
 def downsample_point_cloud(date: str, capture_id: str, voxel_size: float = 0.1) -> Optional[List[List[float]]]:
     """Downsample the point cloud and return as a list of points"""
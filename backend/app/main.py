@@ -1,16 +1,12 @@
 from fastapi import FastAPI, HTTPException, Path as FastAPIPath
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from typing import Any, List
-from PIL import Image
-import numpy as np
+from typing import List, Optional, Tuple
+import asyncio
+import base64
+from concurrent.futures.process import BrokenProcessPool
 import yaml
-import os
-os.environ["PYVISTA_OFF_SCREEN"] = "true"
-os.environ["VTK_USE_OFFSCREEN"] = "true"
-import pyvista as pv
-import io
 from pathlib import Path
 
 app = FastAPI()
@@ -18,20 +14,36 @@ COLOR_YML = Path("config/color_mapping.yml")
 
 _color_cache = None
 _mtime = None
-pv.global_theme.interactive = False
 
 from .config import CORS_ORIGINS
-from .models import CaptureSummary, CaptureDetail, Labels, PointCloudInfo
+from .models import CaptureSummary, CaptureDetail, CaptureBundle, Labels, PointCloudInfo
 from .file_scanner import (
     get_available_dates,
     get_captures_for_date,
     get_capture_detail,
+    get_capture_path,
+    build_capture_detail,
     get_image_path,
     get_point_cloud_path,
+    resolve_point_cloud_file,
+    load_point_cloud_info,
     get_brick_info_path,
+    parse_brick_info,
     downsample_point_cloud
 )
 from .manifest import create_or_update_manifest
+from .rendering import (
+    render_image,
+    render_snapshot_in_renderer,
+    get_snapshot_executor,
+    shutdown_snapshot_executor
+)
+from .render_cache import (
+    get_image_cache_path,
+    get_snapshot_cache_path,
+    read_cached,
+    write_cached
+)
 
 app = FastAPI(title="BRS Classification Review Tool", version="1.0.0")
 
@@ -45,6 +57,19 @@ app.add_middleware(
 )
 
 
+def _store_in_cache(cache_path: Path, data: bytes) -> None:
+    """Write rendered output to the cache; a failed write should not fail the request"""
+    try:
+        write_cached(cache_path, data)
+    except OSError as e:
+        print(f"Error writing render cache {cache_path}: {e}")
+
+
+@app.on_event("shutdown")
+def stop_snapshot_renderer():
+    shutdown_snapshot_executor()
+
+
 @app.get("/")
 async def root():
     return {"message": "BRS Classification Review Tool API"}
@@ -77,6 +102,47 @@ async def get_capture(
     return capture
 
 
+def _load_point_cloud_summary(capture_path: Path, date: str, capture_id: str) -> Tuple[PointCloudInfo, Optional[str]]:
+    """Get point cloud info and, if already cached, the snapshot as a data URI"""
+    pc_path = resolve_point_cloud_file(capture_path)
+    info = load_point_cloud_info(pc_path)
+    if not pc_path:
+        return info, None
+    
+    data = read_cached(pc_path, get_snapshot_cache_path(date, capture_id))
+    if data is None:
+        return info, None
+    return info, "data:image/webp;base64," + base64.b64encode(data).decode("ascii")
+
+
+@app.get("/api/dates/{date}/captures/{capture_id}/bundle", response_model=CaptureBundle)
+async def get_capture_bundle(
+    date: str = FastAPIPath(..., description="Date in YYYY-MM-DD format"),
+    capture_id: str = FastAPIPath(..., description="Capture ID")
+):
+    """Get capture detail, brick info and point cloud info in one response"""
+    capture_path = get_capture_path(date, capture_id)
+    if capture_path is None:
+        raise HTTPException(status_code=404, detail=f"Capture {capture_id} not found for date {date}")
+    
+    # Each part is file I/O, so assemble them concurrently off the event loop
+    try:
+        detail, brick_info, (point_cloud, snapshot_data) = await asyncio.gather(
+            asyncio.to_thread(build_capture_detail, capture_path, date, capture_id),
+            asyncio.to_thread(parse_brick_info, capture_path),
+            asyncio.to_thread(_load_point_cloud_summary, capture_path, date, capture_id),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load capture bundle: {str(e)}")
+    
+    return CaptureBundle(
+        detail=detail,
+        brick_info=brick_info,
+        point_cloud=point_cloud if detail.point_cloud_exists else None,
+        snapshot_data=snapshot_data
+    )
+
+
 @app.put("/api/dates/{date}/captures/{capture_id}/labels")
 async def update_labels(
     labels: Labels,
@@ -108,62 +174,16 @@ async def get_image(
     if not image_path:
         raise HTTPException(status_code=404, detail=f"Image {camera_id} not found for capture {capture_id}")
     
-    try:
-        # Open the image
-        img = Image.open(image_path)
-        
-        # Convert to numpy array
-        img_array = np.array(img)
-        
-        
-        # Convert to float for processing
-        # Handle RGB/RGBA by taking first channel (grayscale stored in all channels)
-        if img_array.ndim == 3:
-            alpha_channel = np.full(img_array.shape[:2], 255, dtype=np.uint8)
-        else:
-            alpha_channel = img_array[:,:,3]
-
-        img_array = img_array[:,:,:3].astype(np.float32)
-
-        # Stretch histogram from actual min/max to full 0-255 range
-        img_min = img_array.min()
-        img_max = img_array.max()
-        
-        if img_max > img_min:
-            # Stretch values from [min, max] to [0, 255]
-            img_array = ((img_array - img_min) / (img_max - img_min) * 255.0)
-        else:
-            # All pixels same value, make them mid-gray
-            img_array = np.full_like(img_array, 128.0)
-        
-        # Convert to uint8
-        img_array = np.clip(img_array, 0, 255).astype(np.uint8)
-        img_array = np.dstack((img_array, alpha_channel))
-        
-        # Convert back to PIL Image
-        img = Image.fromarray(img_array, mode='RGBA')
-
-        # Resize if too large for faster transfer
-        MAX_W = 800
-        if img.width > MAX_W:
-            h = int(img.height * (MAX_W / img.width))
-            img = img.resize((MAX_W, h), Image.BILINEAR)
-        
-        # Save to bytes buffer
-        buf = io.BytesIO()
-        # Convert to WEBP to reduce size
-        img.save(
-            buf,
-            format="WEBP",   # or "JPEG"
-            quality=75,      # 60–85 is a good range
-            method=4         # WebP encoding speed/quality tradeoff (0 fast, 6 best)
-        )
-        buf.seek(0)
-        
-        return StreamingResponse(buf, media_type="image/webp")
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process image: {str(e)}")
+    cache_path = get_image_cache_path(date, capture_id, camera_id)
+    data = read_cached(image_path, cache_path)
+    if data is None:
+        try:
+            data = await asyncio.to_thread(render_image, image_path)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process image: {str(e)}")
+        _store_in_cache(cache_path, data)
+
+    return Response(content=data, media_type="image/webp")
 
 @app.get("/api/dates/{date}/captures/{capture_id}/brick_info")
 async def get_brick_info(
@@ -190,23 +210,7 @@ async def get_point_cloud_info(
     capture_id: str = FastAPIPath(..., description="Capture ID")
 ):
     """Get point cloud information"""
-    pc_path = get_point_cloud_path(date, capture_id)
-    if not pc_path:
-        return PointCloudInfo(exists=False)
-    
-    try:
-        # Load point cloud to get info
-        point_cloud = np.load(pc_path)
-        num_points = len(point_cloud) if point_cloud.ndim > 0 else 0
-        file_size = pc_path.stat().st_size
-        
-        return PointCloudInfo(
-            exists=True,
-            num_points=num_points,
-            file_size=file_size
-        )
-    except Exception as e:
-        return PointCloudInfo(exists=True, num_points=None, file_size=pc_path.stat().st_size)
+    return load_point_cloud_info(get_point_cloud_path(date, capture_id))
     
 @app.get("/api/dates/{date}/captures/{capture_id}/point_cloud/snapshot")
 async def get_point_cloud_snapshot(
@@ -218,58 +222,23 @@ async def get_point_cloud_snapshot(
     if not pc_path:
         raise HTTPException(status_code=404, detail=f"Point cloud not found for capture {capture_id}")
     
-    try:
-        # Load point cloud
-        point_cloud = np.load(pc_path, mmap_mode='r')
-
-        if point_cloud.ndim != 2 or point_cloud.shape[1] < 3:
-            raise HTTPException(status_code=400, detail=f"Unexpected point cloud shape {point_cloud.shape}")
-        
-        xyz = point_cloud.copy()
-        mask = xyz[:, 2] > 1.5
-        xyz = xyz[mask]
-
-        if xyz.size == 0:
-            raise HTTPException(status_code=400, detail="No points above Z > 1.5m for snapshot")
-
-        colors = xyz[:, 3].copy() if xyz.shape[1] >= 4 else None
-        divider = max(1, xyz.shape[0] // 2000)
-        xyz = xyz[::divider, :3]
-        if colors is not None:
-            colors = colors[::divider]
-
-        c = xyz.mean(axis=0)
-        point_cloud_pv = pv.PolyData(xyz)
-
-        plotter_kwargs: dict[str, Any] = {"render_points_as_spheres": True, "point_size": 3}
-        if colors is not None:
-            point_cloud_pv["colors"] = colors
-            plotter_kwargs["scalars"] = "colors"
-
-        # Headless rendering
-        plotter = pv.Plotter(off_screen=True, window_size=(768, 768))
-        plotter.set_background((0.9, 0.9, 0.9))
-        plotter.add_points(point_cloud_pv, **plotter_kwargs)
-
-        # Top view
-        position = (c[0], c[1], c[2] + 100)
-        view_up = (0.0, 1.0, 0.0)
-
-        plotter.camera_position = (position, tuple(c), view_up)
-        plotter.render()
-
-        img = plotter.screenshot(return_img=True)  # numpy HxWx3 uint8
-        plotter.close()
-        
-        # Encode WebP for speed
-        buf = io.BytesIO()
-        Image.fromarray(img).save(buf, format="WEBP", quality=75, method=4)
-        buf.seek(0)
-        
-        return StreamingResponse(buf, media_type="image/webp")
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process point cloud: {str(e)}")
+    cache_path = get_snapshot_cache_path(date, capture_id)
+    data = read_cached(pc_path, cache_path)
+    if data is None:
+        try:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(get_snapshot_executor(), render_snapshot_in_renderer, pc_path)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except BrokenProcessPool as e:
+            # Renderer subprocess died (e.g. a VTK crash); start a fresh one next time
+            shutdown_snapshot_executor()
+            raise HTTPException(status_code=500, detail=f"Failed to process point cloud: {str(e)}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process point cloud: {str(e)}")
+        _store_in_cache(cache_path, data)
+
+    return Response(content=data, media_type="image/webp")
     
 @app.get("/api/dates/{date}/captures/{capture_id}/point_cloud/downsampled")
 async def get_downsampled_point_cloud(
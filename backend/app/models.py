@@ -44,4 +44,11 @@ class PointCloudInfo(BaseModel):
     """Point cloud information"""
     exists: bool
     num_points: Optional[int] = None
-    file_size: Optional[int] = None
\ No newline at end of file
+    file_size: Optional[int] = None
+
+class CaptureBundle(BaseModel):
+    """Everything needed to open a capture, returned in a single response"""
+    detail: CaptureDetail
+    brick_info: Optional[Dict[str, Any]] = None  # parsed brick_info.txt
+    point_cloud: Optional[PointCloudInfo] = None
+    snapshot_data: Optional[str] = None  # data URI, only when the snapshot is already cached
@@ -0,0 +1,158 @@
+"""
+Pre-render point cloud snapshots and camera image variants into the render cache.
+
+Walks one or more dates under RESULTS_ROOT and renders every capture with a
+process pool, one off-screen plotter per worker. Outputs that are newer than
+their source files are skipped, so an interrupted run can simply be restarted.
+
+Usage (from the backend directory):
+    python -m app.prerender 2025-11-15 2025-11-16
+    python -m app.prerender --all --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from .config import RESULTS_ROOT
+from .file_scanner import get_available_dates, get_image_path, get_point_cloud_path
+from .rendering import EmptyPointCloudError, create_plotter, render_image, render_snapshot
+from .render_cache import (
+    get_image_cache_path,
+    get_snapshot_cache_path,
+    is_up_to_date,
+    write_cached
+)
+
+CAMERAS = ['CAM1', 'CAM2', 'CAM3']
+
+# (kind, date, capture_id, camera_id) where kind is "image" or "snapshot"
+Job = Tuple[str, str, str, Optional[str]]
+
+# Per-worker state, set up by _init_worker
+_plotter = None
+_force = False
+
+
+def collect_jobs(dates: List[str], images: bool = True, snapshots: bool = True) -> List[Job]:
+    """List render jobs for every capture under the given dates"""
+    jobs: List[Job] = []
+    for date in dates:
+        date_path = RESULTS_ROOT / date
+        if not date_path.is_dir():
+            continue
+        for capture_path in sorted(date_path.iterdir()):
+            if not capture_path.is_dir():
+                continue
+            capture_id = capture_path.name
+            if snapshots:
+                jobs.append(("snapshot", date, capture_id, None))
+            if images:
+                for camera in CAMERAS:
+                    jobs.append(("image", date, capture_id, camera))
+    return jobs
+
+
+def _init_worker(force: bool) -> None:
+    """Set up per-worker state; the plotter is created on the first snapshot"""
+    global _force
+    _force = force
+
+
+def _get_plotter():
+    """Return this worker's off-screen plotter, creating it on first use"""
+    global _plotter
+    if _plotter is None:
+        _plotter = create_plotter()
+    return _plotter
+
+
+def _run_job(job: Job) -> Tuple[Job, str, Optional[str]]:
+    """Render a single job, returning (job, status, error)"""
+    kind, date, capture_id, camera_id = job
+    try:
+        if kind == "snapshot":
+            source_path = get_point_cloud_path(date, capture_id)
+            cache_path = get_snapshot_cache_path(date, capture_id)
+        else:
+            source_path = get_image_path(date, capture_id, camera_id)
+            cache_path = get_image_cache_path(date, capture_id, camera_id)
+
+        if source_path is None:
+            return job, "missing", None
+        if not _force and is_up_to_date(source_path, cache_path):
+            return job, "skipped", None
+
+        if kind == "snapshot":
+            data = render_snapshot(source_path, _get_plotter())
+        else:
+            data = render_image(source_path)
+        write_cached(cache_path, data)
+        return job, "rendered", None
+    except EmptyPointCloudError as e:
+        # Point cloud has nothing to render; not an error for the batch
+        return job, "empty", str(e)
+    except Exception as e:
+        return job, "failed", str(e)
+
+
+def prerender(dates: List[str], workers: int, force: bool = False,
+              images: bool = True, snapshots: bool = True) -> Counter:
+    """Render all jobs for the given dates and return a count per status"""
+    jobs = collect_jobs(dates, images=images, snapshots=snapshots)
+    counts: Counter = Counter()
+    if not jobs:
+        return counts
+
+    # Spawn so each worker gets its own fresh VTK state
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes=workers, initializer=_init_worker, initargs=(force,)) as pool:
+        for done, (job, status, error) in enumerate(pool.imap_unordered(_run_job, jobs), start=1):
+            counts[status] += 1
+            if status == "failed":
+                kind, date, capture_id, camera_id = job
+                target = f"{kind} {camera_id}" if camera_id else kind
+                print(f"Failed {target} for {date}/{capture_id}: {error}", file=sys.stderr)
+            if done % 100 == 0 or done == len(jobs):
+                print(f"[{done}/{len(jobs)}] rendered={counts['rendered']} skipped={counts['skipped']} failed={counts['failed']}")
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-render snapshots and images into the render cache")
+    parser.add_argument("dates", nargs="*", help="Dates to render (YYYY-MM-DD)")
+    parser.add_argument("--all", action="store_true", help="Render every date under RESULTS_ROOT")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Re-render outputs even if they are up to date")
+    parser.add_argument("--skip-images", action="store_true", help="Do not render camera images")
+    parser.add_argument("--skip-snapshots", action="store_true", help="Do not render point cloud snapshots")
+    args = parser.parse_args(argv)
+
+    available = get_available_dates()
+    if args.all:
+        dates = available
+    elif args.dates:
+        unknown = [d for d in args.dates if d not in available]
+        if unknown:
+            parser.error(f"Date(s) not found under {RESULTS_ROOT}: {', '.join(unknown)}")
+        dates = args.dates
+    else:
+        parser.error("Pass one or more dates or --all")
+
+    counts = prerender(
+        dates,
+        workers=max(1, args.workers),
+        force=args.force,
+        images=not args.skip_images,
+        snapshots=not args.skip_snapshots,
+    )
+    print(f"Done: rendered={counts['rendered']} skipped={counts['skipped']} "
+          f"missing={counts['missing']} empty={counts['empty']} failed={counts['failed']}")
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .config import CACHE_ROOT
+from .rendering import RENDER_VERSION
+
+
+SNAPSHOT_NAME = "snapshot.webp"
+
+
+def _capture_cache_dir(date: str, capture_id: str) -> Path:
+    """Get the cache folder for a capture under the current render version"""
+    return CACHE_ROOT / f"v{RENDER_VERSION}" / date / capture_id
+
+
+def get_snapshot_cache_path(date: str, capture_id: str) -> Path:
+    """Get the cache path for a point cloud snapshot"""
+    return _capture_cache_dir(date, capture_id) / SNAPSHOT_NAME
+
+
+def get_image_cache_path(date: str, capture_id: str, camera_id: str) -> Path:
+    """Get the cache path for a processed camera image"""
+    return _capture_cache_dir(date, capture_id) / f"{camera_id}.webp"
+
+
+def is_up_to_date(source_path: Path, cached_path: Path) -> bool:
+    """Check if a cached file exists and is not older than its source"""
+    try:
+        return cached_path.stat().st_mtime >= source_path.stat().st_mtime
+    except OSError:
+        return False
+
+
+def read_cached(source_path: Path, cached_path: Path) -> Optional[bytes]:
+    """Return cached bytes if the cache entry is up to date, otherwise None"""
+    if not is_up_to_date(source_path, cached_path):
+        return None
+    try:
+        return cached_path.read_bytes()
+    except OSError:
+        return None
+
+
+def write_cached(cached_path: Path, data: bytes) -> None:
+    """Atomically write data to the cache so readers never see partial files"""
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cached_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, cached_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,209 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+import multiprocessing
+import numpy as np
+import io
+import os
+
+if TYPE_CHECKING:
+    import pyvista as pv
+
+# PyVista/VTK and PIL are imported on first use so that starting the API
+# (or any worker that never renders) does not pay their import time and memory.
+_pv = None
+
+# The API renders snapshots in a dedicated subprocess so VTK runs on a process
+# main thread (required by macOS) and stays out of the API worker's memory.
+_snapshot_executor: Optional[ProcessPoolExecutor] = None
+# Set inside the renderer subprocess only
+_renderer_plotter = None
+
+# Bump whenever rendering output changes (sizes, encoding, filtering) so
+# cached renders from older settings are no longer served
+RENDER_VERSION = 1
+
+# Processed camera images are resized down to this width for faster transfer
+MAX_IMAGE_WIDTH = 800
+SNAPSHOT_WINDOW_SIZE = (768, 768)
+
+
+class EmptyPointCloudError(ValueError):
+    """Raised when a point cloud has no points left to render"""
+
+
+def load_pyvista():
+    """Import PyVista configured for off-screen rendering, once per process"""
+    global _pv
+    if _pv is None:
+        os.environ["PYVISTA_OFF_SCREEN"] = "true"
+        os.environ["VTK_USE_OFFSCREEN"] = "true"
+        import pyvista
+
+        pyvista.global_theme.interactive = False
+        _pv = pyvista
+    return _pv
+
+
+def render_image(image_path: Path) -> bytes:
+    """Convert a camera image to WebP, stretching the histogram for visibility"""
+    from PIL import Image
+
+    # Open the image
+    img = Image.open(image_path)
+
+    # Convert to numpy array
+    img_array = np.array(img)
+
+    # Convert to float for processing
+    # Handle RGB/RGBA by taking first channel (grayscale stored in all channels)
+    if img_array.ndim == 3:
+        alpha_channel = np.full(img_array.shape[:2], 255, dtype=np.uint8)
+    else:
+        alpha_channel = img_array[:,:,3]
+
+    img_array = img_array[:,:,:3].astype(np.float32)
+
+    # Stretch histogram from actual min/max to full 0-255 range
+    img_min = img_array.min()
+    img_max = img_array.max()
+
+    if img_max > img_min:
+        # Stretch values from [min, max] to [0, 255]
+        img_array = ((img_array - img_min) / (img_max - img_min) * 255.0)
+    else:
+        # All pixels same value, make them mid-gray
+        img_array = np.full_like(img_array, 128.0)
+
+    # Convert to uint8
+    img_array = np.clip(img_array, 0, 255).astype(np.uint8)
+    img_array = np.dstack((img_array, alpha_channel))
+
+    # Convert back to PIL Image
+    img = Image.fromarray(img_array, mode='RGBA')
+
+    # Resize if too large for faster transfer
+    if img.width > MAX_IMAGE_WIDTH:
+        h = int(img.height * (MAX_IMAGE_WIDTH / img.width))
+        img = img.resize((MAX_IMAGE_WIDTH, h), Image.BILINEAR)
+
+    # Save to bytes buffer
+    buf = io.BytesIO()
+    # Convert to WEBP to reduce size
+    img.save(
+        buf,
+        format="WEBP",   # or "JPEG"
+        quality=75,      # 60–85 is a good range
+        method=4         # WebP encoding speed/quality tradeoff (0 fast, 6 best)
+    )
+    return buf.getvalue()
+
+
+def create_plotter() -> "pv.Plotter":
+    """Create an off-screen plotter for point cloud snapshots"""
+    pv = load_pyvista()
+    plotter = pv.Plotter(off_screen=True, window_size=SNAPSHOT_WINDOW_SIZE)
+    plotter.set_background((0.9, 0.9, 0.9))
+    return plotter
+
+
+def render_snapshot(pc_path: Path, plotter: Optional["pv.Plotter"] = None) -> bytes:
+    """Render a top-view WebP snapshot of a point cloud.
+
+    Pass a plotter from create_plotter() to reuse one renderer across calls;
+    otherwise a temporary plotter is created and closed. Raises
+    EmptyPointCloudError if no points are left after filtering, and
+    ValueError if the point cloud has an unexpected shape.
+    """
+    from PIL import Image
+
+    # Load point cloud
+    point_cloud = np.load(pc_path, mmap_mode='r')
+
+    if point_cloud.ndim != 2 or point_cloud.shape[1] < 3:
+        raise ValueError(f"Unexpected point cloud shape {point_cloud.shape}")
+
+    xyz = point_cloud.copy()
+    mask = xyz[:, 2] > 1.5
+    xyz = xyz[mask]
+
+    if xyz.size == 0:
+        raise EmptyPointCloudError("No points above Z > 1.5m for snapshot")
+
+    colors = xyz[:, 3].copy() if xyz.shape[1] >= 4 else None
+    divider = max(1, xyz.shape[0] // 2000)
+    xyz = xyz[::divider, :3]
+    if colors is not None:
+        colors = colors[::divider]
+
+    c = xyz.mean(axis=0)
+    pv = load_pyvista()
+    point_cloud_pv = pv.PolyData(xyz)
+
+    plotter_kwargs: dict[str, Any] = {"render_points_as_spheres": True, "point_size": 3}
+    if colors is not None:
+        point_cloud_pv["colors"] = colors
+        plotter_kwargs["scalars"] = "colors"
+
+    img = _render_top_view(point_cloud_pv, plotter_kwargs, c, plotter)
+
+    # Encode WebP for speed
+    buf = io.BytesIO()
+    Image.fromarray(img).save(buf, format="WEBP", quality=75, method=4)
+    return buf.getvalue()
+
+
+def _render_top_view(point_cloud_pv: "pv.PolyData", plotter_kwargs: dict[str, Any],
+                     c: np.ndarray, plotter: Optional["pv.Plotter"]) -> np.ndarray:
+    """Render points from above and return the screenshot as an HxWx3 array"""
+    # Headless rendering
+    owns_plotter = plotter is None
+    if owns_plotter:
+        plotter = create_plotter()
+    else:
+        # Plotter.clear() would also remove the lights, so drop only the
+        # previous actors and scalar bars to match a freshly created plotter
+        plotter.clear_actors()
+        plotter.scalar_bars.clear()
+
+    try:
+        plotter.add_points(point_cloud_pv, **plotter_kwargs)
+
+        # Top view
+        position = (c[0], c[1], c[2] + 100)
+        view_up = (0.0, 1.0, 0.0)
+
+        plotter.camera_position = (position, tuple(c), view_up)
+        plotter.render()
+
+        return plotter.screenshot(return_img=True)  # numpy HxWx3 uint8
+    finally:
+        if owns_plotter:
+            plotter.close()
+
+
+def get_snapshot_executor() -> ProcessPoolExecutor:
+    """Return the renderer subprocess pool, starting it on first use"""
+    global _snapshot_executor
+    if _snapshot_executor is None:
+        _snapshot_executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _snapshot_executor
+
+
+def shutdown_snapshot_executor() -> None:
+    """Stop the renderer subprocess; a new one is started on the next render"""
+    global _snapshot_executor
+    if _snapshot_executor is not None:
+        _snapshot_executor.shutdown(wait=False, cancel_futures=True)
+        _snapshot_executor = None
+
+
+def render_snapshot_in_renderer(pc_path: Path) -> bytes:
+    """Render a snapshot inside the renderer subprocess, reusing its plotter"""
+    global _renderer_plotter
+    if _renderer_plotter is None:
+        _renderer_plotter = create_plotter()
+    return render_snapshot(pc_path, _renderer_plotter)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure backend worker boot cost: import time and baseline memory.
+
+Each scenario runs in a fresh interpreter, the same way a uvicorn worker
+starts. "app.main" is what a worker pays today. "app.main + renderer" adds
+the PIL and PyVista/VTK imports that the old main.py did at import time.
+For a true before/after, pass --baseline with the backend directory of an
+older checkout, e.g.:
+
+    git worktree add /tmp/brs-baseline <old-commit>
+    python measure_startup.py --runs 5 --baseline /tmp/brs-baseline/backend
+    git worktree remove /tmp/brs-baseline
+
+Usage:
+    python measure_startup.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCENARIOS = {
+    "app.main": "import app.main",
+    "app.main + renderer": "import app.main\nimport PIL.Image\nfrom app.rendering import load_pyvista\nload_pyvista()",
+}
+
+_PROBE = '''
+import resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+print(f"{{elapsed}} {{rss_mb}}")
+'''
+
+
+def measure(code: str, runs: int, cwd: str):
+    """Return (import seconds, peak RSS MB) samples for a scenario"""
+    times, rss = [], []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(code=code)],
+            capture_output=True, text=True, check=True, cwd=cwd
+        )
+        elapsed, rss_mb = result.stdout.split()
+        times.append(float(elapsed))
+        rss.append(float(rss_mb))
+    return times, rss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure backend import time and baseline RSS")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument("--baseline", help="Backend directory of an older checkout to compare against")
+    args = parser.parse_args()
+
+    scenarios = [(name, code, BACKEND_DIR) for name, code in SCENARIOS.items()]
+    if args.baseline:
+        scenarios.append(("baseline app.main", "import app.main", args.baseline))
+
+    results = {}
+    print(f"{'scenario':<22} {'import (ms)':>12} {'peak RSS (MB)':>14}")
+    for name, code, cwd in scenarios:
+        times, rss = measure(code, args.runs, cwd)
+        results[name] = (statistics.median(times), statistics.median(rss))
+        print(f"{name:<22} {results[name][0] * 1000:>12.0f} {results[name][1]:>14.1f}")
+
+    lazy_time, lazy_rss = results["app.main"]
+    eager_name = "baseline app.main" if args.baseline else "app.main + renderer"
+    eager_time, eager_rss = results[eager_name]
+    print(f"\nSaved per worker vs {eager_name}: {(eager_time - lazy_time) * 1000:.0f} ms, {eager_rss - lazy_rss:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
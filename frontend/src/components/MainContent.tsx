@@ -31,19 +31,6 @@ interface MainContentProps {
   onNextCapture: () => void;
 }
 
-const parseBrickInfo = (text: string) => {
-  const lines = text.split('\n');
-  const info: any = {};
-  lines.forEach(line => {
-    const [key, value] = line.split(':').map(part => part.trim());
-    if (key && value) {
-      const formattedKey = key.toLowerCase().replace(/ /g, '_');
-      info[formattedKey] = isNaN(Number(value)) ? value : Number(value);
-    }
-  });
-  return info as BrickInfo;
-}
-
 const MainContent: React.FC<MainContentProps> = ({
   date,
   capture,
@@ -92,14 +79,15 @@ const MainContent: React.FC<MainContentProps> = ({
       setLoading(true);
       setError(null);
       
-      const detail = await apiService.getCaptureDetail(date, capture.capture_id);
-      const brickInfoText = await apiService.getBrickInfo(date, capture.capture_id);
-      const mappingColor = await apiService.getColorMapping();
+      const [bundle, mappingColor] = await Promise.all([
+        apiService.getCaptureBundle(date, capture.capture_id),
+        apiService.getColorMapping(),
+      ]);
+      const detail = bundle.detail;
 
-      // Parse and convert brickInfoText to BrickInfo object
-      const parsedBrickInfo = parseBrickInfo(brickInfoText);
-      // Change the value of color_prediction based on color mapping
-      if (parsedBrickInfo.color_prediction && mappingColor[parsedBrickInfo.color_prediction]) {
+      // Brick info arrives parsed; map color_prediction through the color mapping
+      const parsedBrickInfo = bundle.brick_info ?? null;
+      if (parsedBrickInfo?.color_prediction && mappingColor[parsedBrickInfo.color_prediction]) {
         const colorId = parsedBrickInfo.color_prediction;
         const colorData = mappingColor[String(colorId)];
         // Extract name and RGB if it's an object
@@ -136,17 +124,12 @@ const MainContent: React.FC<MainContentProps> = ({
         });
       }
       
-      // Load point cloud info if it exists
+      // Point cloud info comes with the bundle; the snapshot is inlined when already cached
       if (detail.point_cloud_exists) {
-        try {
-          const pcInfo = await apiService.getPointCloudInfo(date, capture.capture_id);
-          const snapshotUrl = apiService.getPointCloudSnapshotUrl(date, capture.capture_id);
-          setPointCloudInfo({ ...pcInfo });
-          setGetPointCloudSnapshotUrl(snapshotUrl);
-        } catch (pcError) {
-          console.warn('Failed to load point cloud info:', pcError);
-          setPointCloudInfo({ exists: true });
-        }
+        setPointCloudInfo(bundle.point_cloud ?? { exists: true });
+        setGetPointCloudSnapshotUrl(
+          bundle.snapshot_data ?? apiService.getPointCloudSnapshotUrl(date, capture.capture_id)
+        );
       } else {
         setPointCloudInfo(null);
       }
@@ -1,4 +1,4 @@
-import { CaptureSummary, CaptureDetail, Labels, PointCloudInfo } from '../types/api';
+import { CaptureSummary, CaptureBundle, Labels } from '../types/api';
 
 const API_BASE_URL = 'http://127.0.0.1:8000/api';
 
@@ -43,9 +43,9 @@ export const apiService = {
     return fetchApi<CaptureSummary[]>(`/dates/${date}/captures`);
   },
 
-  // Get detailed capture information
-  async getCaptureDetail(date: string, captureId: string): Promise<CaptureDetail> {
-    return fetchApi<CaptureDetail>(`/dates/${date}/captures/${captureId}`);
+  // Get capture detail, brick info and point cloud info in one request
+  async getCaptureBundle(date: string, captureId: string): Promise<CaptureBundle> {
+    return fetchApi<CaptureBundle>(`/dates/${date}/captures/${captureId}/bundle`);
   },
 
   // Update labels for a capture
@@ -61,17 +61,6 @@ export const apiService = {
     return `${API_BASE_URL}/dates/${date}/captures/${captureId}/image/${cameraId}`;
   },
 
-  // Get brick_info txt file contents
-  async getBrickInfo(date: string, captureId: string): Promise<string> {
-    const response = await fetchApi<{ content: string }>(`/dates/${date}/captures/${captureId}/brick_info`);
-    return response.content;
-  },
-
-  // Get point cloud info
-  async getPointCloudInfo(date: string, captureId: string): Promise<PointCloudInfo> {
-    return fetchApi<PointCloudInfo>(`/dates/${date}/captures/${captureId}/point_cloud/info`);
-  },
-
   //Get point cloud snapshot image URL
   getPointCloudSnapshotUrl(date: string, captureId: string): string {
     return `${API_BASE_URL}/dates/${date}/captures/${captureId}/point_cloud/snapshot`;
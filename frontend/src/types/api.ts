@@ -48,4 +48,11 @@ export interface PointCloudInfo {
   exists: boolean;
   num_points?: number;
   file_size?: number;
+}
+
+export interface CaptureBundle {
+  detail: CaptureDetail;
+  brick_info?: BrickInfo;
+  point_cloud?: PointCloudInfo;
+  snapshot_data?: string; // data URI, only when the snapshot is already cached
 }
\ No newline at end of file